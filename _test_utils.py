@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the backend test scripts
+"""
+
+import atexit
+import re
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional: parses the large analyze responses faster than the stdlib decoder
+    import orjson
+except ImportError:
+    orjson = None
+
+# One pooled session per script run, so every request to the backend reuses a keep-alive connection;
+# connection errors and gateway errors are retried with backoff instead of failing the run
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False
+    )
+))
+atexit.register(SESSION.close)
+
+# 1x1 pixel PNG uploaded by the analyze-screenshot tests
+TEST_PNG_BYTES = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\tpHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xe5\x07\x16\x0f\x1d\x0c\xc8\xc8\xc8\x00\x00\x00\x0cIDATx\x9cc```\x00\x00\x00\x04\x00\x01\xf5\xc7\xdd\x8c\x00\x00\x00\x00IEND\xaeB`\x82'
+
+BACKEND_HEALTH_URL = "http://localhost:8000/health"
+
+def wait_for_backend(session=SESSION, url=BACKEND_HEALTH_URL, timeout=10.0):
+    """Poll the health endpoint with exponential backoff until it answers 200 or timeout seconds pass"""
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        try:
+            if session.get(url, timeout=0.5).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        delay = min(0.05 * 2 ** attempt, 1.0)
+        if time.monotonic() + delay > deadline:
+            print(f"Backend did not become ready within {timeout:.0f}s")
+            return False
+        time.sleep(delay)
+        attempt += 1
+
+def compile_indicators(indicators):
+    """Compile indicator phrases into one alternation that finds any of them as a substring"""
+    return re.compile("|".join(map(re.escape, indicators)))
+
+def idea_text(idea, *fields):
+    """Lowercased text of an idea's fields, joined so every indicator can be matched in one search"""
+    return "\n".join(idea.get(field, '') for field in fields).lower()
+
+def response_json(response):
+    """Decode a JSON response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def truncate(text, limit=2048):
+    """Bound a response body before printing it, noting how much was cut"""
+    text = str(text)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...<+{len(text) - limit} chars>"
@@ -2,21 +2,40 @@
 API endpoints for the AI Growth Backlog Generator
 """
 
+import logging
 import os
 import tempfile
 from typing import Dict, Any
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-import json
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Multipart uploads over 1 MB are spooled to tempfile's directory. Setting UPLOAD_TMPDIR
+# (e.g. to /dev/shm to keep that write in RAM) redirects it; this affects every tempfile
+# user in the process, so it is opt-in
+UPLOAD_TMPDIR = os.getenv("UPLOAD_TMPDIR")
+if UPLOAD_TMPDIR:
+    tempfile.tempdir = UPLOAD_TMPDIR
+
+from app.core.log_config import setup_logging, shutdown_logging
 from app.services.growth_analyzer import GrowthAnalyzer
 
-app = FastAPI(title="AI Growth Backlog Generator API")
+logger = logging.getLogger(__name__)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, which also handles NumPy scalars and arrays"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+app = FastAPI(title="AI Growth Backlog Generator API", default_response_class=ORJSONResponse)
 
 # Get frontend URL from environment or use confirmed working default
 FRONTEND_URL = os.getenv("FRONTEND_URL", "https://ai-yushas-growth-backlog-generator-ui.onrender.com")
@@ -36,12 +55,24 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Compress larger JSON payloads such as the ideas list
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Add startup event to log CORS configuration
 @app.on_event("startup")
 async def startup_event():
-    print(f"FastAPI app starting up...")
-    print(f"CORS configured for frontend: {FRONTEND_URL}")
-    print(f"OpenAI API Key configured: {'Yes' if os.getenv('OPENAI_API_KEY') else 'No'}")
+    setup_logging()
+    logger.info("FastAPI app starting up...")
+    logger.info("CORS configured for frontend: %s", FRONTEND_URL)
+    logger.info("OpenAI API Key configured: %s", 'Yes' if os.getenv('OPENAI_API_KEY') else 'No')
+    # Pay the DNS/TCP/TLS setup cost now rather than on the first upload
+    await growth_analyzer.warm_up_connection()
+
+# Close pooled OpenAI connections when the worker exits
+@app.on_event("shutdown")
+async def shutdown_event():
+    await growth_analyzer.aclose()
+    shutdown_logging()
 
 # Initialize the growth analyzer
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -50,65 +81,81 @@ if not OPENAI_API_KEY:
 
 growth_analyzer = GrowthAnalyzer(OPENAI_API_KEY)
 
+# Uploads must declare an image MIME type (image/png, image/jpeg, ...)
+IMAGE_CONTENT_TYPE_PREFIX = 'image/'
+
+# Largest accepted upload, and the chunk size used while reading it
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(20 * 1024 * 1024)))
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 class AnalysisResponse(BaseModel):
     ideas: list
     summary: dict
     metadata: dict
 
-@app.post("/analyze-screenshot", response_model=AnalysisResponse)
-async def analyze_screenshot(file: UploadFile = File(...)):
+# The analysis dict is returned as-is; the model only documents the response shape
+@app.post("/analyze-screenshot", response_model=None, responses={200: {"model": AnalysisResponse}})
+async def analyze_screenshot(request: Request, file: UploadFile = File(...)):
     """
     Analyze a screenshot and generate growth backlog with ICE scores
     """
     try:
-        print(f"Received file: {file.filename}, content_type: {file.content_type}")
+        # Reject oversized requests before buffering the upload
+        try:
+            content_length = int(request.headers.get('content-length', '0'))
+        except ValueError:
+            content_length = 0
+        if content_length > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="File too large")
+        
+        logger.info("Received file: %s, content_type: %s", file.filename, file.content_type)
         
         # Validate file type
-        if not file.content_type.startswith('image/'):
+        if not (file.content_type or '').startswith(IMAGE_CONTENT_TYPE_PREFIX):
             raise HTTPException(status_code=400, detail="File must be an image")
         
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Keep the upload in memory; the analyzer decodes it directly.
+        # Read in chunks so a missing or wrong Content-Length can't bypass the limit.
+        chunks = []
+        file_size = 0
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=413, detail="File too large")
+            chunks.append(chunk)
+        content = b''.join(chunks)
         
         try:
-            print(f"Starting analysis of file: {temp_file_path}")
-            print(f"File size: {len(content)} bytes")
+            logger.debug("Starting analysis of file: %s (%d bytes)", file.filename, len(content))
             
-            # Analyze the screenshot
-            analysis_result = growth_analyzer.analyze_landing_page(temp_file_path)
+            # Analyze the screenshot; the analyzer reuses cached results for identical uploads
+            # and pushes its blocking OpenCV/OCR stages onto worker threads
+            analysis_result = await growth_analyzer.analyze_landing_page_async(content)
             
-            print(f"Analysis completed. Ideas count: {len(analysis_result.get('ideas', []))}")
-            print(f"Summary: {analysis_result.get('summary', {})}")
+            logger.info("Analysis completed. Ideas count: %d", len(analysis_result.get('ideas', [])))
+            logger.debug("Summary: %s", analysis_result.get('summary', {}))
             
-            return AnalysisResponse(
-                ideas=analysis_result['ideas'],
-                summary=analysis_result['summary'],
-                metadata=analysis_result['metadata']
-            )
+            ideas = analysis_result['ideas']
+            # Fallback ideas are encoded once at startup; embed those bytes instead of re-serializing
+            if ideas is growth_analyzer.scored_fallback_ideas:
+                ideas = orjson.Fragment(growth_analyzer.scored_fallback_ideas_json)
+            
+            # Rendered by orjson directly; FastAPI's jsonable_encoder can't walk a Fragment
+            return ORJSONResponse({
+                'ideas': ideas,
+                'summary': analysis_result['summary'],
+                'metadata': analysis_result['metadata']
+            })
             
         except Exception as analysis_error:
-            print(f"Analysis error: {str(analysis_error)}")
-            print(f"Error type: {type(analysis_error)}")
-            import traceback
-            print(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Analysis error (%s): %s", type(analysis_error).__name__, analysis_error)
             raise HTTPException(status_code=500, detail=f"Analysis failed: {str(analysis_error)}")
-            
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
                 
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
-        print(f"Unexpected error: {str(e)}")
-        print(f"Error type: {type(e)}")
-        import traceback
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Unexpected error (%s): %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 @app.get("/health")
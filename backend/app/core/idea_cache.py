@@ -0,0 +1,99 @@
+"""
+Response cache for LLM idea generation
+Exact matches are keyed by a hash of the request; near-duplicate pages can
+optionally be matched by embedding similarity
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .cache import LRUCache
+
+class IdeaCache:
+    """Caches parsed idea lists by request hash, with an optional semantic lookup tier"""
+
+    def __init__(self, maxsize: int = 5000, ttl: Optional[float] = 86400,
+                 similarity_threshold: float = 0.92):
+        """
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl: Seconds a cached response stays valid, or None to keep it until evicted
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.similarity_threshold = similarity_threshold
+        self._ideas = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._embeddings: OrderedDict = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """Return a stable SHA-256 key for a JSON-serializable request payload"""
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """Return the ideas cached under key, or None"""
+        ideas = self._ideas.get(key)
+        return list(ideas) if ideas is not None else None
+
+    def set(self, key: str, ideas: List[Dict], embedding: Optional[np.ndarray] = None,
+            namespace: str = ''):
+        """
+        Cache ideas under key, optionally indexing them for semantic lookup
+
+        Args:
+            key: Request key from make_key
+            ideas: Parsed ideas returned by the model
+            embedding: Embedding of the request's page text, if semantic lookup is enabled
+            namespace: Kind of request, so semantic hits never cross prompt types
+        """
+        self._ideas.set(key, list(ideas))
+        if embedding is None:
+            return
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return
+        with self._lock:
+            self._embeddings[key] = (namespace, vector / norm)
+            self._embeddings.move_to_end(key)
+            while len(self._embeddings) > self._maxsize:
+                self._embeddings.popitem(last=False)
+
+    def get_similar(self, embedding: np.ndarray, namespace: str = '') -> Optional[List[Dict]]:
+        """Return the cached ideas whose page embedding is most similar, if above the threshold"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return None
+
+        with self._lock:
+            candidates = [(key, stored) for key, (ns, stored) in self._embeddings.items() if ns == namespace]
+        if not candidates:
+            return None
+
+        similarities = np.vstack([stored for _, stored in candidates]) @ (vector / norm)
+        for i in np.argsort(-similarities):
+            if similarities[i] < self.similarity_threshold:
+                break
+            # Entries can expire from the idea store before their embedding is pruned
+            ideas = self.get(candidates[i][0])
+            if ideas is not None:
+                return ideas
+        return None
+
+    def clear(self):
+        """Drop every cached response"""
+        self._ideas.clear()
+        with self._lock:
+            self._embeddings.clear()
+
+    def __len__(self) -> int:
+        return len(self._ideas)
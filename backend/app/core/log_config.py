@@ -0,0 +1,52 @@
+"""
+Logging configuration for the API workers
+Log records are handed to a queue so request handlers never block on stream I/O
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def setup_logging(level: Optional[str] = None) -> logging.handlers.QueueListener:
+    """
+    Route root logger output through a QueueHandler drained by a background listener
+    
+    Args:
+        level: Root log level, defaults to the LOG_LEVEL environment variable or INFO
+        
+    Returns:
+        QueueListener: The running listener (created once per process)
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+    
+    root = logging.getLogger()
+    
+    # Keep any handlers the server already installed, but move them behind the queue
+    handlers = root.handlers[:]
+    if not handlers:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers = [stream_handler]
+    
+    log_queue = queue.SimpleQueue()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level or os.getenv("LOG_LEVEL", "INFO").upper())
+    
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
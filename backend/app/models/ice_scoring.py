@@ -3,9 +3,145 @@ ICE (Impact, Confidence, Effort) Scoring System
 for prioritizing CRO ideas based on growth best practices
 """
 
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import math
 
+import numpy as np
+
+try:
+    # Optional: JIT-compiles the batch ICE kernel
+    import numba
+except ImportError:
+    numba = None
+
+# Lookup tables shared by every scorer instance
+CATEGORY_WEIGHTS = {
+    'copy': 1.2,
+    'design': 1.1,
+    'ux': 1.3,
+    'technical': 0.9,
+    'layout': 1.0
+}
+
+COMPLEXITY_SCORES = {'low': -2, 'medium': 0, 'high': 2}
+
+# (flag, score adjustment) pairs applied in order when the flag is set
+IMPACT_FACTORS = (
+    ('affects_value_proposition', 2.0),
+    ('affects_cta', 1.5),
+    ('affects_trust', 1.0),
+    ('affects_social_proof', 1.0),
+)
+
+CONFIDENCE_FACTORS = (
+    ('follows_best_practices', 1.5),
+    ('industry_standard', 1.0),
+)
+
+EFFORT_FACTORS = (
+    ('requires_design', 1),
+    ('requires_copywriting', 0.5),
+    ('requires_ab_testing', 1),
+    ('requires_user_research', 1.5),
+)
+
+# Priority levels indexed by code (0 = low, 1 = medium, 2 = high); batch scoring
+# hands out these shared strings rather than building a new one per idea
+PRIORITY_LEVELS = ('low', 'medium', 'high')
+
+# Every component score is clamped to this range
+SCORE_MIN = 1.0
+SCORE_MAX = 10.0
+
+def _clamp_score(score: float) -> float:
+    """Clamp a single raw component score to the 1-10 range"""
+    return min(SCORE_MAX, max(SCORE_MIN, score))
+
+def _impact_inputs(idea_data: Dict) -> Tuple:
+    """Primitive fields the impact score depends on"""
+    g = idea_data.get
+    return g('category', 'layout'), tuple(bool(g(key)) for key, _ in IMPACT_FACTORS)
+
+def _confidence_inputs(idea_data: Dict) -> Tuple:
+    """Primitive fields the confidence score depends on"""
+    g = idea_data.get
+    return (
+        bool(g('has_case_studies')),
+        g('case_study_count', 0) > 3,
+        tuple(bool(g(key)) for key, _ in CONFIDENCE_FACTORS),
+        g('reasoning_strength', 0.5)
+    )
+
+def _effort_inputs(idea_data: Dict) -> Tuple:
+    """Primitive fields the effort score depends on"""
+    g = idea_data.get
+    return (
+        g('complexity', 'medium'),
+        g('dev_time_days', 3),
+        tuple(bool(g(key)) for key, _ in EFFORT_FACTORS)
+    )
+
+# Idea data only varies over a handful of enums and booleans, so the raw
+# (unclamped) scores below are memoized on those primitive fields.
+@lru_cache(maxsize=4096)
+def _raw_impact_score(category: str, flags: Tuple[bool, ...]) -> float:
+    """Unclamped impact score for a category and the IMPACT_FACTORS flags"""
+    base_score = 5.0 * CATEGORY_WEIGHTS.get(category, 1.0)
+    for (_, weight), flag in zip(IMPACT_FACTORS, flags):
+        if flag:
+            base_score += weight
+    return base_score
+
+@lru_cache(maxsize=4096)
+def _raw_confidence_score(has_case_studies: bool, many_case_studies: bool,
+                          flags: Tuple[bool, ...], reasoning_strength: float) -> float:
+    """Unclamped confidence score for case study evidence and the CONFIDENCE_FACTORS flags"""
+    base_score = 5.0
+    if has_case_studies:
+        base_score += 2.0
+    if many_case_studies:
+        base_score += 1.0
+    for (_, weight), flag in zip(CONFIDENCE_FACTORS, flags):
+        if flag:
+            base_score += weight
+    base_score += reasoning_strength * 2.0
+    return base_score
+
+@lru_cache(maxsize=4096)
+def _raw_effort_score(complexity: str, dev_time_days: float, flags: Tuple[bool, ...]) -> float:
+    """Unclamped effort score for complexity, development time and the EFFORT_FACTORS flags"""
+    base_score = 5.0 + COMPLEXITY_SCORES.get(complexity, 0)
+    if dev_time_days <= 1:
+        base_score -= 2
+    elif dev_time_days <= 3:
+        base_score -= 1
+    elif dev_time_days >= 7:
+        base_score += 2
+    for (_, weight), flag in zip(EFFORT_FACTORS, flags):
+        if flag:
+            base_score += weight
+    return base_score
+
+def _compute_ice_numpy(impact: np.ndarray, confidence: np.ndarray, effort: np.ndarray) -> np.ndarray:
+    """Unrounded ICE scores for aligned component arrays, 0 where effort is 0"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(effort == 0, 0.0, impact * confidence / effort)
+
+# With NUMBA_DISABLE_JIT set, njit kernels run as plain Python loops, so the
+# NumPy twins are used instead
+if numba is not None and not numba.config.DISABLE_JIT:
+    # No fastmath: results must stay bit-identical to calculate_ice_score
+    @numba.njit(cache=True)
+    def _compute_ice(impact, confidence, effort):
+        """Unrounded ICE scores for aligned component arrays, 0 where effort is 0"""
+        out = np.empty_like(impact)
+        for i in range(impact.shape[0]):
+            out[i] = impact[i] * confidence[i] / effort[i] if effort[i] != 0 else 0.0
+        return out
+else:
+    _compute_ice = _compute_ice_numpy
+
 class ICEScorer:
     """ICE Scoring system for CRO idea prioritization"""
     
@@ -44,32 +180,7 @@ class ICEScorer:
         Returns:
             float: Impact score between 1-10
         """
-        base_score = 5.0
-        
-        # Adjust based on category
-        category_weights = {
-            'copy': 1.2,
-            'design': 1.1,
-            'ux': 1.3,
-            'technical': 0.9,
-            'layout': 1.0
-        }
-        
-        category = idea_data.get('category', 'layout')
-        base_score *= category_weights.get(category, 1.0)
-        
-        # Adjust based on specific factors
-        if idea_data.get('affects_value_proposition'):
-            base_score += 2.0
-        if idea_data.get('affects_cta'):
-            base_score += 1.5
-        if idea_data.get('affects_trust'):
-            base_score += 1.0
-        if idea_data.get('affects_social_proof'):
-            base_score += 1.0
-            
-        # Cap at 10
-        return min(10.0, max(1.0, base_score))
+        return _clamp_score(_raw_impact_score(*_impact_inputs(idea_data)))
     
     def calculate_confidence(self, idea_data: Dict) -> float:
         """
@@ -81,26 +192,7 @@ class ICEScorer:
         Returns:
             float: Confidence score between 1-10
         """
-        base_score = 5.0
-        
-        # Evidence from case studies
-        if idea_data.get('has_case_studies'):
-            base_score += 2.0
-        if idea_data.get('case_study_count', 0) > 3:
-            base_score += 1.0
-            
-        # Best practice alignment
-        if idea_data.get('follows_best_practices'):
-            base_score += 1.5
-        if idea_data.get('industry_standard'):
-            base_score += 1.0
-            
-        # Logical reasoning strength
-        reasoning_strength = idea_data.get('reasoning_strength', 0.5)
-        base_score += reasoning_strength * 2.0
-        
-        # Cap at 10
-        return min(10.0, max(1.0, base_score))
+        return _clamp_score(_raw_confidence_score(*_confidence_inputs(idea_data)))
     
     def calculate_effort(self, idea_data: Dict) -> float:
         """
@@ -112,36 +204,7 @@ class ICEScorer:
         Returns:
             float: Effort score between 1-10 (higher = more effort)
         """
-        base_score = 5.0
-        
-        # Implementation complexity
-        complexity = idea_data.get('complexity', 'medium')
-        complexity_scores = {'low': -2, 'medium': 0, 'high': 2}
-        base_score += complexity_scores.get(complexity, 0)
-        
-        # Development time
-        dev_time_days = idea_data.get('dev_time_days', 3)
-        if dev_time_days <= 1:
-            base_score -= 2
-        elif dev_time_days <= 3:
-            base_score -= 1
-        elif dev_time_days >= 7:
-            base_score += 2
-            
-        # Design work required
-        if idea_data.get('requires_design'):
-            base_score += 1
-        if idea_data.get('requires_copywriting'):
-            base_score += 0.5
-            
-        # Testing requirements
-        if idea_data.get('requires_ab_testing'):
-            base_score += 1
-        if idea_data.get('requires_user_research'):
-            base_score += 1.5
-            
-        # Cap at 10
-        return min(10.0, max(1.0, base_score))
+        return _clamp_score(_raw_effort_score(*_effort_inputs(idea_data)))
     
     def calculate_ice_score(self, impact: float, confidence: float, effort: float) -> float:
         """
@@ -204,6 +267,69 @@ class ICEScorer:
             'implementation_time': self._estimate_time(effort)
         }
     
+    def score_batch(self, items: List[Dict]) -> np.ndarray:
+        """
+        Score many ideas' ICE data in one vectorized pass
+        
+        Args:
+            items: List of dictionaries containing idea analysis data
+            
+        Returns:
+            np.ndarray: (N, 4) array of unrounded impact, confidence and effort, and the ICE score
+        """
+        count = len(items)
+        if count == 0:
+            return np.empty((0, 4))
+        
+        # Gather raw scores, then clamp each component in one vectorized pass
+        impact = np.clip(
+            np.fromiter((_raw_impact_score(*_impact_inputs(item)) for item in items), dtype=float, count=count),
+            SCORE_MIN, SCORE_MAX
+        )
+        confidence = np.clip(
+            np.fromiter((_raw_confidence_score(*_confidence_inputs(item)) for item in items), dtype=float, count=count),
+            SCORE_MIN, SCORE_MAX
+        )
+        effort = np.clip(
+            np.fromiter((_raw_effort_score(*_effort_inputs(item)) for item in items), dtype=float, count=count),
+            SCORE_MIN, SCORE_MAX
+        )
+        
+        raw_ice = _compute_ice(impact, confidence, effort)
+        # Python's round() keeps results identical to calculate_ice_score
+        ice = np.fromiter((round(value, 2) for value in raw_ice.tolist()), dtype=float, count=count)
+        return np.column_stack((impact, confidence, effort, ice))
+    
+    def score_ideas(self, ideas: List[Dict]) -> List[Dict]:
+        """
+        Score a batch of CRO ideas and return them sorted by ICE score
+        
+        Args:
+            ideas: List of dictionaries containing idea analysis data
+            
+        Returns:
+            List[Dict]: Ideas merged with their ICE metrics, highest ICE score first
+        """
+        if not ideas:
+            return []
+        
+        impact, confidence, effort, ice = self.score_batch(ideas).T
+        priority_codes = np.select([ice >= 8.0, ice >= 4.0], [2, 1], 0).tolist()
+        order = np.argsort(-ice, kind='stable')
+        
+        return [
+            ideas[i] | {
+                'impact': round(float(impact[i]), 1),
+                'confidence': round(float(confidence[i]), 1),
+                'effort': round(float(effort[i]), 1),
+                'ice_score': float(ice[i]),
+                'priority': PRIORITY_LEVELS[priority_codes[i]],
+                'estimated_lift': self._estimate_lift(impact[i], confidence[i]),
+                'implementation_time': self._estimate_time(effort[i])
+            }
+            for i in order.tolist()
+        ]
+    
     def _estimate_lift(self, impact: float, confidence: float) -> str:
         """Estimate conversion lift based on impact and confidence"""
         expected_lift = (impact * confidence) / 100 * 25  # Base 25% max lift
@@ -226,14 +352,20 @@ class ICEScorer:
         else:
             return "1-2 weeks"
     
-    def sort_ideas_by_priority(self, ideas: List[Dict]) -> List[Dict]:
+    def sort_ideas_by_priority(self, ideas: List[Dict], scores: Optional[np.ndarray] = None) -> List[Dict]:
         """
         Sort ideas by ICE score in descending order
         
         Args:
             ideas: List of ideas with ICE scores
+            scores: ICE scores aligned with ideas; read from each idea's 'ice_score' when omitted
             
         Returns:
             List[Dict]: Sorted ideas by priority
         """
-        return sorted(ideas, key=lambda x: x.get('ice_score', 0), reverse=True) 
\ No newline at end of file
+        if not ideas:
+            return []
+        
+        if scores is None:
+            scores = np.fromiter((x.get('ice_score', 0) for x in ideas), dtype=float, count=len(ideas))
+        return [ideas[i] for i in np.argsort(-scores, kind='stable').tolist()] 
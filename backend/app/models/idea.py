@@ -0,0 +1,55 @@
+"""
+CRO idea model
+Compact, immutable idea records passed through the analysis pipeline;
+ideas only become dicts at the API boundary
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping
+
+# Enum-like fields repeat across every idea, so parsed values are interned
+_INTERNED_FIELDS = ('category', 'priority')
+
+@dataclass(slots=True, frozen=True)
+class Idea:
+    """A single CRO idea"""
+    title: str
+    description: str = ''
+    hypothesis: str = ''
+    category: str = 'general'
+    reasoning: str = ''
+    implementation: str = ''
+    success_metrics: str = ''
+    priority: str = 'medium'
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'Idea':
+        """
+        Build an idea from parsed model output
+
+        Args:
+            data: Idea fields; missing fields get their defaults and unknown keys are dropped
+
+        Returns:
+            Idea: The parsed idea
+        """
+        values = {name: data[name] for name in cls.__dataclass_fields__ if name in data}
+        for name in _INTERNED_FIELDS:
+            if isinstance(values.get(name), str):
+                values[name] = sys.intern(values[name])
+        values.setdefault('title', '')
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the idea's fields as a plain dict for JSON responses"""
+        return {
+            'title': self.title,
+            'description': self.description,
+            'hypothesis': self.hypothesis,
+            'category': self.category,
+            'reasoning': self.reasoning,
+            'implementation': self.implementation,
+            'success_metrics': self.success_metrics,
+            'priority': self.priority
+        }
@@ -0,0 +1,783 @@
+"""
+Static CRO idea catalogs used when AI idea generation is unavailable
+Built once at import as immutable Idea records that callers share instead of copying
+"""
+
+import re
+from dataclasses import replace
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Set, Tuple
+
+from ..models.idea import Idea
+
+def triggered_ideas(entries: Iterable[Tuple[Tuple[str, ...], Idea]], triggers: FrozenSet[str]) -> List[Idea]:
+    """Return the ideas with any trigger phrase in triggers, as found by find_triggers"""
+    return [idea for phrases, idea in entries if not triggers.isdisjoint(phrases)]
+
+def find_triggers(text_lower: str) -> FrozenSet[str]:
+    """Return every catalog trigger phrase that occurs in the lowercased page text, in one scan"""
+    found: Set[str] = set()
+    for match in _TRIGGER_RE.finditer(text_lower):
+        found |= _TRIGGER_PREFIXES[match.group(1)]
+    return frozenset(found)
+
+# Visual-analysis ideas per detected element: (idea when present, idea when missing);
+# "{count}" in a description is filled with the number of detected elements
+VISUAL_ELEMENT_IDEAS = {
+    'buttons': (
+        Idea(
+            title='Optimize Existing CTA Button Copy and Design',
+            description='Improve the {count} detected CTA buttons with action-oriented copy and better visual hierarchy',
+            hypothesis='Better CTA design will increase click-through rates by 20-30%',
+            category='design',
+            reasoning='Existing CTAs can be optimized for better conversion performance',
+            implementation='1. Analyze current button text 2. Replace with action-oriented copy 3. Test button colors and sizes 4. A/B test variations',
+            success_metrics='Click-through rate, conversion rate',
+            priority='high'
+        ),
+        Idea(
+            title='Add Primary CTA Button in Hero Section',
+            description='Create a prominent call-to-action button in the hero section to capture user attention',
+            hypothesis='Adding a primary CTA will increase conversion by 40-60%',
+            category='design',
+            reasoning='Hero CTAs are critical for capturing immediate user interest',
+            implementation='1. Design prominent CTA button 2. Use action-oriented copy 3. Place in hero section 4. Test button colors',
+            success_metrics='Click-through rate, conversion rate',
+            priority='high'
+        )
+    ),
+    'forms': (
+        Idea(
+            title='Optimize Form Fields and Reduce Friction',
+            description='Improve the {count} detected form fields to reduce abandonment and increase completion',
+            hypothesis='Form optimization will increase completion rates by 30-50%',
+            category='ux',
+            reasoning='Forms are major conversion points that often have high abandonment rates',
+            implementation='1. Audit current form fields 2. Remove unnecessary fields 3. Add progress indicator 4. Improve field labels',
+            success_metrics='Form completion rate, conversion rate, time to complete',
+            priority='high'
+        ),
+        Idea(
+            title='Add Lead Capture Form Below Hero',
+            description='Create a lead capture form to collect email addresses and generate leads',
+            hypothesis='Adding lead capture will increase lead generation by 50-100%',
+            category='ux',
+            reasoning='Lead capture forms are essential for building email lists and generating leads',
+            implementation='1. Design simple lead form 2. Add compelling offer 3. Place below hero section 4. Test form copy',
+            success_metrics='Lead capture rate, email signups',
+            priority='high'
+        )
+    ),
+    'headlines': (
+        Idea(
+            title='Rewrite Hero Headline for Better Value Proposition',
+            description='Optimize the main headline to focus on specific benefits and clear value proposition',
+            hypothesis='Benefit-focused headline will increase conversion by 25-35%',
+            category='copy',
+            reasoning='Headlines are the first thing users see and need to communicate immediate value',
+            implementation='1. Identify primary user benefit 2. Rewrite headline to lead with benefit 3. A/B test variations 4. Measure conversion lift',
+            success_metrics='Click-through rate, bounce rate, conversion rate',
+            priority='high'
+        ),
+        Idea(
+            title='Add Compelling Hero Headline',
+            description='Create a benefit-focused headline that immediately communicates value to visitors',
+            hypothesis='Adding a compelling headline will increase engagement by 40-60%',
+            category='copy',
+            reasoning='Hero headlines are critical for capturing user attention and communicating value',
+            implementation='1. Identify primary user benefit 2. Write benefit-focused headline 3. Test different variations 4. Optimize for clarity',
+            success_metrics='Time on page, bounce rate, engagement',
+            priority='high'
+        )
+    ),
+    'images': (
+        Idea(
+            title='Optimize Images for Better Conversion',
+            description='Improve the visual content to better support conversion goals and user engagement',
+            hypothesis='Optimized images will increase engagement and conversion by 15-25%',
+            category='design',
+            reasoning='Visual content can significantly impact user perception and conversion',
+            implementation='1. Audit current images 2. Replace with conversion-focused visuals 3. Add customer photos 4. Test image placement',
+            success_metrics='Time on page, engagement, conversion rate',
+            priority='medium'
+        ),
+        Idea(
+            title='Add Customer Photos and Social Proof Images',
+            description='Include customer photos, testimonials, and social proof images to build trust',
+            hypothesis='Adding customer photos will increase trust and conversion by 20-40%',
+            category='social_proof',
+            reasoning='Customer photos and social proof build trust and reduce purchase anxiety',
+            implementation='1. Collect customer photos 2. Add testimonial images 3. Include company logos 4. Place strategically',
+            success_metrics='Trust score, conversion rate, time on page',
+            priority='medium'
+        )
+    ),
+    'mobile': (
+        Idea(
+            title='Optimize Mobile Experience and Touch Targets',
+            description='Improve mobile usability with better touch targets and mobile-first design',
+            hypothesis='Mobile optimization will increase mobile conversion by 30-50%',
+            category='ux',
+            reasoning='Mobile users have different needs and behaviors than desktop users',
+            implementation='1. Test mobile experience 2. Optimize touch targets 3. Improve mobile navigation 4. Test mobile forms',
+            success_metrics='Mobile conversion rate, bounce rate, time on page',
+            priority='high'
+        ),
+        Idea(
+            title='Add Mobile-Responsive Design Elements',
+            description='Ensure the page works well on mobile devices with responsive design',
+            hypothesis='Mobile responsiveness will increase mobile conversion by 25-40%',
+            category='technical',
+            reasoning='Mobile traffic is significant and requires optimized experience',
+            implementation='1. Test mobile layout 2. Optimize for mobile screens 3. Improve mobile navigation 4. Test mobile CTAs',
+            success_metrics='Mobile conversion rate, mobile bounce rate',
+            priority='medium'
+        )
+    ),
+    'colors': (
+        Idea(
+            title='Optimize Color Scheme for Better Conversion',
+            description='Test different color combinations to improve visual hierarchy and conversion',
+            hypothesis='Optimized colors will increase conversion by 10-20%',
+            category='design',
+            reasoning='Colors affect user psychology and can significantly impact conversion',
+            implementation='1. Test CTA button colors 2. Optimize color contrast 3. Test background colors 4. A/B test color schemes',
+            success_metrics='Conversion rate, click-through rate',
+            priority='medium'
+        ),
+        None
+    ),
+}
+
+# Proven growth ideas always added to the visual-analysis ideas
+VISUAL_ANALYSIS_IDEAS = (
+    Idea(
+        title='Add Customer Testimonials Section Below Hero',
+        description='Create a testimonials section with customer quotes, photos, and specific results',
+        hypothesis='Adding social proof will increase conversion by 25-40%',
+        category='social_proof',
+        reasoning='Social proof reduces purchase anxiety and builds credibility - especially important for new visitors',
+        implementation='1. Collect 3-5 customer testimonials with photos 2. Include specific results and company names 3. Design testimonial cards 4. Place below hero section 5. Add trust badges',
+        success_metrics='Conversion rate, bounce rate, time on page',
+        priority='high'
+    ),
+    Idea(
+        title='Add Security Badges and Money-Back Guarantee',
+        description='Display SSL certificate, security badges, and money-back guarantee prominently on the page',
+        hypothesis='Trust signals will reduce purchase anxiety and increase conversion by 15-25%',
+        category='trust',
+        reasoning='Trust signals reduce friction and build confidence, especially for new customers',
+        implementation='1. Add SSL certificate badge 2. Display money-back guarantee 3. Show customer count or satisfaction rate 4. Add security certifications 5. Place near CTAs',
+        success_metrics='Conversion rate, cart abandonment rate, trust score',
+        priority='medium'
+    ),
+    Idea(
+        title='Add Limited-Time Offer with Countdown Timer',
+        description='Create urgency by adding a limited-time offer with a countdown timer near the CTA',
+        hypothesis='Urgency will increase conversion by 20-35%',
+        category='ux',
+        reasoning='Urgency creates FOMO and motivates immediate action',
+        implementation='1. Create limited-time offer (e.g., "50% off for first 100 customers") 2. Add countdown timer 3. Place near primary CTA 4. Test different timeframes',
+        success_metrics='Conversion rate, time to purchase, cart abandonment',
+        priority='medium'
+    ),
+)
+
+@lru_cache(maxsize=256)
+def visual_analysis_ideas(buttons: int, forms: int, headlines: int, images: int,
+                          mobile: bool, colors: int) -> Tuple[Idea, ...]:
+    """Return the visual-analysis ideas for detected element counts; few combinations occur, so memoize"""
+    ideas = []
+    detected = (('buttons', buttons), ('forms', forms), ('headlines', headlines),
+                ('images', images), ('mobile', mobile), ('colors', colors))
+    for element, count in detected:
+        present_idea, missing_idea = VISUAL_ELEMENT_IDEAS[element]
+        idea = present_idea if count else missing_idea
+        if idea is not None:
+            ideas.append(replace(idea, description=idea.description.format(count=count)))
+    return tuple(ideas) + VISUAL_ANALYSIS_IDEAS
+
+# CTA copy ideas triggered by phrases found in the page text
+TEXT_TRIGGERED_IDEAS = (
+    (('get started',), Idea(
+        title='Change "Get Started" to "Start Your Free Trial"',
+        description='Replace generic "Get Started" with more specific, benefit-focused CTA that emphasizes the free trial',
+        hypothesis='Specific trial-focused CTA will increase conversion by 30-40%',
+        category='copy',
+        reasoning='Free trial language reduces friction and increases signup intent',
+        implementation='1. Change button text from "Get Started" to "Start Your Free Trial" 2. Test alternatives like "Try for Free" or "Begin Free Trial" 3. A/B test against current version',
+        success_metrics='Click-through rate, conversion rate',
+        priority='high'
+    )),
+    (('sign up',), Idea(
+        title='Change "Sign Up" to "Create Your Account"',
+        description='Replace "Sign Up" with more welcoming, account-focused language',
+        hypothesis='Account-focused language will increase conversion by 20-30%',
+        category='copy',
+        reasoning='Account creation feels more permanent and valuable than signing up',
+        implementation='1. Change button text from "Sign Up" to "Create Your Account" 2. Test alternatives like "Join Now" or "Get Started" 3. A/B test against current version',
+        success_metrics='Click-through rate, conversion rate',
+        priority='medium'
+    )),
+    (('learn more',), Idea(
+        title='Change "Learn More" to "See How It Works"',
+        description='Replace generic "Learn More" with specific, action-oriented copy',
+        hypothesis='Specific action language will increase engagement by 25-35%',
+        category='copy',
+        reasoning='Specific actions are more compelling than generic learning language',
+        implementation='1. Change button text from "Learn More" to "See How It Works" 2. Test alternatives like "Watch Demo" or "See Examples" 3. A/B test against current version',
+        success_metrics='Click-through rate, engagement rate',
+        priority='medium'
+    )),
+    (('free',), Idea(
+        title='Add "No Credit Card Required" to Free Trial CTA',
+        description='Add risk-reducing language to free trial CTAs to increase signup confidence',
+        hypothesis='Risk-reducing language will increase trial signup by 40-60%',
+        category='trust',
+        reasoning='Removing credit card requirement reduces signup friction',
+        implementation='1. Add "No Credit Card Required" below free trial CTAs 2. Test placement and styling 3. A/B test against current version',
+        success_metrics='Trial signup rate, conversion rate',
+        priority='high'
+    )),
+    (('download',), Idea(
+        title='Add "Download in 30 Seconds" to Download CTA',
+        description='Add time expectation to download CTAs to reduce perceived friction',
+        hypothesis='Time expectation will increase download rate by 25-35%',
+        category='ux',
+        reasoning='Setting time expectations reduces perceived effort',
+        implementation='1. Add "Download in 30 Seconds" below download buttons 2. Test different timeframes 3. A/B test against current version',
+        success_metrics='Download rate, conversion rate',
+        priority='medium'
+    )),
+)
+
+# Learning platforms (e.g. MasterClass)
+LEARNING_TRIGGERED_IDEAS = (
+    (('masterclass',), Idea(
+        title='Change "Get MasterClass" to "Start Learning Today"',
+        description='Replace the generic "Get MasterClass" CTA with more specific, action-oriented copy that emphasizes immediate learning',
+        hypothesis='Action-oriented CTA will increase conversion by 25-35%',
+        category='copy',
+        reasoning='Specific action-focused CTAs convert better than generic "get" language',
+        implementation='1. Change button text from "Get MasterClass" to "Start Learning Today" 2. Test alternatives like "Begin Your Journey" or "Access All Classes" 3. A/B test against current version',
+        success_metrics='Click-through rate, conversion rate',
+        priority='high'
+    )),
+    (('learn from the best',), Idea(
+        title='Add Specific Instructor Names Below "LEARN FROM THE BEST"',
+        description='Add 3-4 specific instructor names below the main headline to provide immediate credibility and interest',
+        hypothesis='Specific instructor names will increase engagement and conversion by 30-40%',
+        category='copy',
+        reasoning='Specific names are more compelling than generic "best" language',
+        implementation='1. Add instructor names like "Learn from Gordon Ramsay, Serena Williams, and Neil deGrasse Tyson" 2. Place below main headline 3. Include instructor photos',
+        success_metrics='Time on page, scroll depth, conversion rate',
+        priority='high'
+    )),
+    (('bite-sized lessons',), Idea(
+        title='Add "Complete a Lesson in 10 Minutes" Social Proof',
+        description='Add specific social proof about lesson completion time to emphasize the bite-sized nature',
+        hypothesis='Time-specific social proof will increase conversion by 25-35%',
+        category='social_proof',
+        reasoning='Time commitment is a major barrier - showing quick wins builds confidence',
+        implementation='1. Add "Complete a lesson in just 10 minutes" 2. Include completion rate stats 3. Place below hero section 4. Add student testimonials',
+        success_metrics='Conversion rate, lesson completion rate',
+        priority='high'
+    )),
+)
+LEARNING_IDEAS = (
+    Idea(
+        title='Add "What Do You Want to Learn?" Quiz',
+        description='Create an interactive learning preference quiz to engage users and provide personalized recommendations',
+        hypothesis='Personalized recommendations will increase conversion by 40-60%',
+        category='ux',
+        reasoning='Personalization increases relevance and engagement',
+        implementation='1. Create 5-question learning preference quiz 2. Provide personalized course recommendations 3. Collect email for results 4. Follow up with relevant content',
+        success_metrics='Engagement rate, conversion rate, email signups',
+        priority='high'
+    ),
+    Idea(
+        title='Add "Student Success Stories" Section',
+        description='Show specific student achievements and career improvements from taking courses',
+        hypothesis='Student success stories will increase conversion by 35-50%',
+        category='social_proof',
+        reasoning='Specific results are more compelling than generic testimonials',
+        implementation='1. Collect student success stories 2. Include before/after career improvements 3. Add student photos and names 4. Place after hero section',
+        success_metrics='Conversion rate, time on page',
+        priority='high'
+    ),
+    Idea(
+        title='Add "Free Sample Lesson" CTA',
+        description='Offer a free sample lesson to reduce friction and demonstrate value',
+        hypothesis='Free sample will increase trial signup by 50-80%',
+        category='ux',
+        reasoning='Free samples reduce purchase anxiety and demonstrate value',
+        implementation='1. Create free sample lesson page 2. Add "Try a Free Lesson" CTA 3. Collect email for access 4. Follow up with course recommendations',
+        success_metrics='Trial signup rate, email capture rate',
+        priority='high'
+    ),
+    Idea(
+        title='Add "Course Completion Certificates" Feature',
+        description='Highlight that students receive certificates upon course completion',
+        hypothesis='Certificates will increase conversion by 20-30%',
+        category='trust',
+        reasoning='Certificates provide tangible value and career benefits',
+        implementation='1. Add certificate preview to course pages 2. Show certificate examples 3. Highlight career benefits 4. Add to course descriptions',
+        success_metrics='Conversion rate, course completion rate',
+        priority='medium'
+    ),
+)
+
+# Meditation apps (e.g. Calm)
+MEDITATION_TRIGGERED_IDEAS = (
+    (('calm',), Idea(
+        title='Change "Try Calm for Free" to "Start Your Free Meditation"',
+        description='Replace the generic "Try Calm for Free" CTA with more specific, benefit-focused copy that emphasizes the meditation aspect',
+        hypothesis='Benefit-specific CTA will increase conversion by 25-35%',
+        category='copy',
+        reasoning='Specific benefit-focused CTAs convert better than generic "try" language',
+        implementation='1. Change button text from "Try Calm for Free" to "Start Your Free Meditation" 2. Test alternative versions like "Begin Your Meditation Journey" 3. A/B test against current version',
+        success_metrics='Click-through rate, conversion rate',
+        priority='high'
+    )),
+    (('calm your mind',), Idea(
+        title='Add Specific Benefits Below "Calm your mind. Change your life."',
+        description='Add 3-4 specific benefits below the main headline to provide immediate value proposition',
+        hypothesis='Specific benefits will increase engagement and conversion by 20-30%',
+        category='copy',
+        reasoning='Specific benefits are more compelling than generic statements',
+        implementation='1. Add bullet points: "• Fall asleep 3x faster • Reduce stress by 40% • Improve focus by 60%" 2. Place below main headline 3. Use benefit-focused language',
+        success_metrics='Time on page, scroll depth, conversion rate',
+        priority='high'
+    )),
+)
+MEDITATION_IDEAS = (
+    Idea(
+        title='Add "7-Day Sleep Challenge" Free Trial',
+        description='Create a specific 7-day sleep improvement challenge instead of generic free trial',
+        hypothesis='Specific challenge will increase trial signup by 40-60%',
+        category='ux',
+        reasoning='Specific challenges are more compelling than generic trials',
+        implementation='1. Create "7-Day Sleep Challenge" landing page 2. Add specific daily goals 3. Include progress tracking 4. Send daily emails',
+        success_metrics='Trial signup rate, completion rate',
+        priority='high'
+    ),
+    Idea(
+        title='Add "Before/After Sleep Quality" Testimonials',
+        description='Show specific sleep improvement results with before/after comparisons',
+        hypothesis='Specific sleep results will increase conversion by 35-50%',
+        category='social_proof',
+        reasoning='Specific results are more compelling than generic testimonials',
+        implementation='1. Collect sleep quality improvement stories 2. Create before/after comparisons 3. Include specific metrics (hours slept, quality score) 4. Add customer photos',
+        success_metrics='Conversion rate, time on page',
+        priority='high'
+    ),
+)
+
+# E-commerce sites
+ECOMMERCE_IDEAS = (
+    Idea(
+        title='Add "Free Shipping" Badge Near CTAs',
+        description='Display free shipping offer prominently to reduce purchase anxiety',
+        hypothesis='Free shipping will increase conversion by 20-30%',
+        category='trust',
+        reasoning='Free shipping reduces purchase friction and builds trust',
+        implementation='1. Add "Free Shipping" badge near product CTAs 2. Make badge prominent and colorful 3. Test different placements',
+        success_metrics='Conversion rate, cart abandonment rate',
+        priority='high'
+    ),
+    Idea(
+        title='Add "Customer Reviews" Section',
+        description='Display customer reviews and ratings to build trust',
+        hypothesis='Customer reviews will increase conversion by 25-40%',
+        category='social_proof',
+        reasoning='Customer reviews build trust and reduce purchase anxiety',
+        implementation='1. Add customer review section 2. Include star ratings 3. Show review photos 4. Place near product CTAs',
+        success_metrics='Conversion rate, trust score',
+        priority='high'
+    ),
+)
+
+# SaaS platforms
+SAAS_IDEAS = (
+    Idea(
+        title='Add "Free Trial" CTA',
+        description='Offer free trial to reduce friction and demonstrate value',
+        hypothesis='Free trial will increase conversion by 40-60%',
+        category='ux',
+        reasoning='Free trials reduce purchase anxiety and demonstrate value',
+        implementation='1. Add "Start Free Trial" CTA 2. Make trial offer prominent 3. Collect email for trial access 4. Follow up with onboarding',
+        success_metrics='Trial signup rate, conversion rate',
+        priority='high'
+    ),
+    Idea(
+        title='Add "How It Works" Section',
+        description='Create step-by-step guide showing how the software works',
+        hypothesis='Process clarity will increase understanding and conversion by 20-30%',
+        category='ux',
+        reasoning='Clear process reduces confusion and builds confidence',
+        implementation='1. Create 3-4 step process guide 2. Add screenshots or videos 3. Use simple language 4. Place after hero section',
+        success_metrics='Time on page, conversion rate',
+        priority='medium'
+    ),
+)
+
+# Pages whose business type is unclear
+GENERIC_TRIGGERED_IDEAS = (
+    (('free',), Idea(
+        title='Optimize "Free" Offer Messaging',
+        description='Make the free offer more prominent and specific to increase conversion',
+        hypothesis='Better free offer messaging will increase conversion by 20-30%',
+        category='copy',
+        reasoning='Free offers reduce friction and increase trial signups',
+        implementation='1. Make free offer more prominent 2. Add specific value proposition 3. Test different free offer copy 4. A/B test placement',
+        success_metrics='Conversion rate, trial signup rate',
+        priority='high'
+    )),
+    (('get', 'start'), Idea(
+        title='Improve CTA Button Copy',
+        description='Make the call-to-action button more specific and action-oriented',
+        hypothesis='Better CTA copy will increase click-through by 25-35%',
+        category='copy',
+        reasoning='Specific action-oriented CTAs convert better than generic ones',
+        implementation='1. Test different CTA variations 2. Use action-oriented language 3. Add benefit-focused copy 4. A/B test different versions',
+        success_metrics='Click-through rate, conversion rate',
+        priority='high'
+    )),
+)
+
+# Proven growth tactics used to top up idea lists
+TACTICAL_FALLBACK_IDEAS = (
+    Idea(
+        title='Add "As Seen In" Media Logos Section',
+        description='Display logos of media outlets, publications, or companies that have featured or used your product',
+        hypothesis='Media logos will increase credibility and conversion by 15-25%',
+        category='social_proof',
+        reasoning='Media logos act as third-party validation and build instant credibility',
+        implementation='1. Collect media logos (Forbes, TechCrunch, etc.) 2. Create "As Seen In" section 3. Place above or below hero 4. Ensure logos are clickable to articles',
+        success_metrics='Conversion rate, trust score, time on page',
+        priority='medium'
+    ),
+    Idea(
+        title='Add "Join X,XXX+ Customers" Social Proof',
+        description='Display the number of customers or users prominently on the page',
+        hypothesis='Customer count will increase social proof and conversion by 10-20%',
+        category='social_proof',
+        reasoning='Large numbers create social proof and reduce purchase anxiety',
+        implementation='1. Calculate total customers/users 2. Create "Join X,XXX+ customers" text 3. Place near CTA or hero section 4. Update number regularly',
+        success_metrics='Conversion rate, trust score',
+        priority='low'
+    ),
+    Idea(
+        title='Add "Free Trial" or "Money-Back Guarantee" Badge',
+        description='Display a prominent badge showing free trial or money-back guarantee',
+        hypothesis='Risk reversal will increase conversion by 20-35%',
+        category='trust',
+        reasoning='Risk reversal reduces purchase anxiety and increases confidence',
+        implementation='1. Design guarantee badge 2. Place near CTA buttons 3. Make badge prominent and colorful 4. Link to guarantee terms',
+        success_metrics='Conversion rate, cart abandonment rate',
+        priority='medium'
+    ),
+    Idea(
+        title='Add "Limited Time" or "Exclusive" Offer',
+        description='Create urgency with limited-time pricing or exclusive access',
+        hypothesis='Scarcity will increase conversion by 25-40%',
+        category='ux',
+        reasoning='Scarcity creates FOMO and motivates immediate action',
+        implementation='1. Create limited-time offer 2. Add countdown timer 3. Use "Exclusive" or "Limited Time" language 4. Place near CTAs',
+        success_metrics='Conversion rate, time to purchase',
+        priority='medium'
+    ),
+    Idea(
+        title='Add "How It Works" Step-by-Step Section',
+        description='Create a visual step-by-step guide showing how your product works',
+        hypothesis='Process clarity will increase understanding and conversion by 15-25%',
+        category='ux',
+        reasoning='Clear process reduces confusion and builds confidence',
+        implementation='1. Break down process into 3-4 steps 2. Add icons or visuals 3. Use simple language 4. Place after hero section',
+        success_metrics='Time on page, conversion rate, bounce rate',
+        priority='low'
+    ),
+    Idea(
+        title='Add "Before/After" Case Study Section',
+        description='Show specific results with before/after comparisons',
+        hypothesis='Specific results will increase conversion by 30-50%',
+        category='social_proof',
+        reasoning='Specific results are more compelling than generic testimonials',
+        implementation='1. Find customer with measurable results 2. Create before/after comparison 3. Include specific metrics 4. Add customer photo and name',
+        success_metrics='Conversion rate, time on page',
+        priority='high'
+    ),
+    Idea(
+        title='Add "FAQ" Section to Address Objections',
+        description='Create FAQ section addressing common customer concerns',
+        hypothesis='Addressing objections will increase conversion by 10-20%',
+        category='copy',
+        reasoning='FAQs preemptively address concerns that might prevent purchase',
+        implementation='1. Identify common objections 2. Create FAQ section 3. Use clear, benefit-focused answers 4. Place before footer',
+        success_metrics='Conversion rate, support inquiries',
+        priority='low'
+    ),
+    Idea(
+        title='Add "Live Chat" or "Support" Indicator',
+        description='Show that help is available with live chat or support indicators',
+        hypothesis='Support availability will increase confidence and conversion by 10-15%',
+        category='trust',
+        reasoning='Support availability reduces purchase anxiety',
+        implementation='1. Add live chat widget 2. Show support hours 3. Display response time 4. Place in visible location',
+        success_metrics='Conversion rate, support inquiries',
+        priority='low'
+    ),
+    Idea(
+        title='Add "Mobile-First" Design Optimization',
+        description='Ensure the page is optimized for mobile users with responsive design',
+        hypothesis='Mobile optimization will increase mobile conversion by 20-40%',
+        category='technical',
+        reasoning='Mobile users have different needs and behaviors than desktop users',
+        implementation='1. Test mobile experience 2. Optimize button sizes 3. Improve mobile navigation 4. Test mobile forms',
+        success_metrics='Mobile conversion rate, bounce rate',
+        priority='medium'
+    ),
+    Idea(
+        title='Add "A/B Testing" Framework',
+        description='Set up systematic A/B testing for key page elements',
+        hypothesis='A/B testing will identify winning variations and increase conversion by 10-30%',
+        category='technical',
+        reasoning='Data-driven optimization consistently outperforms guesswork',
+        implementation='1. Set up A/B testing tool 2. Test headlines, CTAs, images 3. Run tests for statistical significance 4. Implement winning variations',
+        success_metrics='Conversion rate improvement, test win rate',
+        priority='medium'
+    ),
+)
+
+# Comprehensive fallback ideas when no other ideas could be generated
+FALLBACK_IDEAS = (
+    Idea(
+        title='Add Customer Testimonials Section',
+        description='Add a testimonials section with real customer quotes and photos below the hero section',
+        hypothesis='Adding social proof will increase conversion by 15-25%',
+        category='social_proof',
+        reasoning='Social proof builds trust and reduces purchase anxiety',
+        implementation='1. Collect customer testimonials 2. Design testimonial cards 3. Add below hero section 4. Include customer photos and names',
+        success_metrics='Conversion rate increase, time on page, scroll depth',
+        priority='high'
+    ),
+    Idea(
+        title='Optimize Hero Headline',
+        description='Rewrite the main headline to focus on the primary benefit and include a clear value proposition',
+        hypothesis='A benefit-focused headline will increase conversion by 20-30%',
+        category='copy',
+        reasoning='Clear value propositions immediately communicate what users will gain',
+        implementation='1. Identify primary user benefit 2. A/B test 3-5 headline variations 3. Measure click-through rates',
+        success_metrics='Click-through rate, bounce rate, conversion rate',
+        priority='high'
+    ),
+    Idea(
+        title='Add Trust Badges',
+        description='Display security badges, certifications, and guarantees prominently on the page',
+        hypothesis='Trust signals will increase conversion by 10-15%',
+        category='trust',
+        reasoning='Trust badges reduce purchase anxiety and build credibility',
+        implementation='1. Add SSL badge 2. Display money-back guarantee 3. Show customer count 4. Add security certifications',
+        success_metrics='Conversion rate, cart abandonment rate',
+        priority='medium'
+    ),
+    Idea(
+        title='Improve CTA Button Design',
+        description='Make the primary CTA button more prominent with better contrast and compelling copy',
+        hypothesis='A more prominent CTA will increase click-through rates by 25-40%',
+        category='design',
+        reasoning='Button prominence and copy directly impact conversion rates',
+        implementation='1. Increase button size 2. Use high-contrast colors 3. Test action-oriented copy 4. Add hover effects',
+        success_metrics='Click-through rate, conversion rate',
+        priority='high'
+    ),
+    Idea(
+        title='Add Urgency Elements',
+        description='Include countdown timers, limited-time offers, or stock scarcity indicators',
+        hypothesis='Urgency will increase conversion by 15-25%',
+        category='ux',
+        reasoning='Urgency creates FOMO and accelerates decision-making',
+        implementation='1. Add countdown timer 2. Show limited stock 3. Display expiring offers 4. Test different urgency messages',
+        success_metrics='Conversion rate, time to purchase',
+        priority='medium'
+    ),
+    Idea(
+        title='Optimize Form Fields',
+        description='Reduce form fields to minimum required and add progress indicators',
+        hypothesis='Reducing form friction will increase completion rates by 20-35%',
+        category='ux',
+        reasoning='Every form field reduces conversion likelihood',
+        implementation='1. Remove unnecessary fields 2. Add progress bar 3. Use smart defaults 4. Add field validation',
+        success_metrics='Form completion rate, time to complete',
+        priority='high'
+    ),
+    Idea(
+        title='Add Social Proof Numbers',
+        description='Display customer count, reviews count, or other social proof metrics prominently',
+        hypothesis='Social proof numbers will increase trust and conversion by 10-20%',
+        category='social_proof',
+        reasoning='Numbers provide concrete evidence of popularity and trust',
+        implementation='1. Add customer count 2. Display review count 3. Show satisfaction rate 4. Add "as featured in" logos',
+        success_metrics='Conversion rate, trust indicators',
+        priority='medium'
+    ),
+    Idea(
+        title='Improve Mobile Responsiveness',
+        description='Ensure all elements are properly sized and spaced for mobile devices',
+        hypothesis='Better mobile experience will increase mobile conversion by 30-50%',
+        category='technical',
+        reasoning='Mobile users have different needs and behaviors than desktop users',
+        implementation='1. Test on multiple devices 2. Optimize touch targets 3. Improve loading speed 4. Simplify navigation',
+        success_metrics='Mobile conversion rate, bounce rate',
+        priority='high'
+    ),
+    Idea(
+        title='Add FAQ Section',
+        description='Create a comprehensive FAQ section to address common objections and questions',
+        hypothesis='FAQ section will reduce support inquiries and increase conversion by 10-15%',
+        category='copy',
+        reasoning='FAQs address objections before they become barriers to conversion',
+        implementation='1. Research common questions 2. Write clear answers 3. Add searchable FAQ 4. Link from key areas',
+        success_metrics='Support ticket reduction, conversion rate',
+        priority='medium'
+    ),
+    Idea(
+        title='Implement Exit-Intent Popup',
+        description='Show a compelling offer when users are about to leave the page',
+        hypothesis='Exit-intent popup will recover 5-15% of abandoning visitors',
+        category='ux',
+        reasoning='Exit-intent captures users who would otherwise leave without converting',
+        implementation='1. Design compelling offer 2. Set up exit detection 3. A/B test different offers 4. Track performance',
+        success_metrics='Recovery rate, additional conversions',
+        priority='medium'
+    ),
+    Idea(
+        title='Add Video Testimonials',
+        description='Include video testimonials from satisfied customers to build trust',
+        hypothesis='Video testimonials will increase conversion by 20-35%',
+        category='social_proof',
+        reasoning='Video testimonials are more engaging and credible than text',
+        implementation='1. Record customer testimonials 2. Edit for clarity 3. Add to hero section 4. Include transcripts',
+        success_metrics='Engagement rate, conversion rate, time on page',
+        priority='high'
+    ),
+    Idea(
+        title='Optimize Page Load Speed',
+        description='Improve page loading speed by optimizing images, scripts, and server response',
+        hypothesis='Faster loading will increase conversion by 10-20%',
+        category='technical',
+        reasoning='Page speed directly impacts user experience and search rankings',
+        implementation='1. Compress images 2. Minify CSS/JS 3. Enable caching 4. Use CDN',
+        success_metrics='Page load time, bounce rate, conversion rate',
+        priority='medium'
+    ),
+    Idea(
+        title='Add Money-Back Guarantee',
+        description='Prominently display a money-back guarantee to reduce purchase risk',
+        hypothesis='Money-back guarantee will increase conversion by 15-25%',
+        category='trust',
+        reasoning='Guarantees reduce perceived risk and increase purchase confidence',
+        implementation='1. Design guarantee badge 2. Add to multiple locations 3. Include terms 4. Test different guarantees',
+        success_metrics='Conversion rate, refund rate',
+        priority='high'
+    ),
+    Idea(
+        title='Create Comparison Table',
+        description='Add a comparison table showing your product vs competitors',
+        hypothesis='Comparison table will increase conversion by 20-30%',
+        category='copy',
+        reasoning='Comparison tables help users make informed decisions quickly',
+        implementation='1. Research competitors 2. Create comparison matrix 3. Highlight advantages 4. Add to pricing section',
+        success_metrics='Conversion rate, time to decision',
+        priority='medium'
+    ),
+    Idea(
+        title='Add Live Chat Support',
+        description='Implement live chat to provide immediate support and answer questions',
+        hypothesis='Live chat will increase conversion by 10-20%',
+        category='ux',
+        reasoning='Live chat reduces friction and provides immediate assistance',
+        implementation='1. Choose chat platform 2. Set up chat widget 3. Train support team 4. Monitor performance',
+        success_metrics='Chat engagement, conversion rate',
+        priority='medium'
+    ),
+    Idea(
+        title='Optimize Above-the-Fold Content',
+        description='Ensure the most important content and CTA are visible without scrolling',
+        hypothesis='Better above-the-fold content will increase conversion by 25-40%',
+        category='layout',
+        reasoning='Users make decisions based on what they see immediately',
+        implementation='1. Audit above-the-fold content 2. Prioritize key elements 3. Test different layouts 4. Measure engagement',
+        success_metrics='Scroll depth, conversion rate',
+        priority='high'
+    ),
+    Idea(
+        title='Add Social Media Proof',
+        description='Display social media feeds, follower counts, or social sharing buttons',
+        hypothesis='Social media proof will increase trust and conversion by 10-15%',
+        category='social_proof',
+        reasoning='Social media presence builds credibility and trust',
+        implementation='1. Add social media feeds 2. Display follower counts 3. Show social shares 4. Link to social profiles',
+        success_metrics='Social engagement, conversion rate',
+        priority='low'
+    ),
+    Idea(
+        title='Implement A/B Testing Framework',
+        description='Set up A/B testing to continuously optimize page elements',
+        hypothesis='A/B testing will increase conversion by 10-30% over time',
+        category='technical',
+        reasoning='Data-driven optimization leads to better performance',
+        implementation='1. Choose testing platform 2. Set up tracking 3. Create test hypotheses 4. Run continuous tests',
+        success_metrics='Test win rate, overall conversion improvement',
+        priority='high'
+    ),
+    Idea(
+        title='Add Progress Indicators',
+        description='Show progress bars or step indicators for multi-step processes',
+        hypothesis='Progress indicators will increase completion rates by 15-25%',
+        category='ux',
+        reasoning='Progress indicators reduce anxiety and increase completion likelihood',
+        implementation='1. Add progress bars 2. Show step numbers 3. Include time estimates 4. Test different designs',
+        success_metrics='Completion rate, time to complete',
+        priority='medium'
+    ),
+    Idea(
+        title='Optimize for Voice Search',
+        description='Include natural language keywords and FAQ content for voice search optimization',
+        hypothesis='Voice search optimization will increase organic traffic by 15-25%',
+        category='technical',
+        reasoning='Voice search is growing rapidly and requires different optimization',
+        implementation='1. Research voice keywords 2. Add natural language content 3. Optimize for featured snippets 4. Test voice queries',
+        success_metrics='Voice search traffic, featured snippet appearances',
+        priority='low'
+    ),
+)
+
+# Ideas per business type: (trigger-gated ideas, ideas always included); triggered ideas come first
+BUSINESS_IDEAS = {
+    'meditation_app': (MEDITATION_TRIGGERED_IDEAS, MEDITATION_IDEAS),
+    'learning_platform': (LEARNING_TRIGGERED_IDEAS, LEARNING_IDEAS),
+    'ecommerce': ((), ECOMMERCE_IDEAS),
+    'saas': ((), SAAS_IDEAS),
+    'generic': (GENERIC_TRIGGERED_IDEAS, ()),
+}
+
+def business_ideas(business_type: str, triggers: FrozenSet[str]) -> List[Idea]:
+    """Return the catalog ideas for a business type, unknown types getting the generic ideas"""
+    triggered, always = BUSINESS_IDEAS.get(business_type, BUSINESS_IDEAS['generic'])
+    return [*triggered_ideas(triggered, triggers), *always]
+
+# Every trigger phrase, matched as a plain substring like `phrase in text`. The lookahead tries
+# each position and the longest phrase wins there; any shorter phrase starting at the same
+# position is a prefix of it, so matched phrases expand to all of their trigger prefixes.
+TRIGGER_PHRASES = tuple(sorted(
+    {phrase for catalog in (TEXT_TRIGGERED_IDEAS, LEARNING_TRIGGERED_IDEAS, MEDITATION_TRIGGERED_IDEAS,
+                            GENERIC_TRIGGERED_IDEAS)
+     for phrases, _ in catalog for phrase in phrases},
+    key=len, reverse=True
+))
+_TRIGGER_RE = re.compile("(?=(%s))" % "|".join(map(re.escape, TRIGGER_PHRASES)))
+_TRIGGER_PREFIXES = {
+    phrase: frozenset(prefix for prefix in TRIGGER_PHRASES if phrase.startswith(prefix))
+    for phrase in TRIGGER_PHRASES
+}
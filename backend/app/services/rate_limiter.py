@@ -0,0 +1,84 @@
+"""
+Client-side rate limiting for OpenAI requests
+Keeps request and token throughput under the account's RPM/TPM limits
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Optional
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> Optional[Any]:
+    """Return the tiktoken encoding for a model, or None if it cannot be loaded (e.g. offline)"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception as e:
+        logger.warning("Token encoding unavailable for %s, estimating from length: %s", model, e)
+        return None
+
+def estimate_tokens(text: str, model: str = "gpt-4o") -> int:
+    """Estimate how many prompt tokens text will use for a model"""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+class RateLimiter:
+    """Token-bucket limiter tracking requests and tokens per minute"""
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0):
+        """
+        Args:
+            requests_per_minute: Allowed requests per minute, or 0 for no limit
+            tokens_per_minute: Allowed tokens per minute, or 0 for no limit
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = float(requests_per_minute)
+        self._available_tokens = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        # Guards the buckets only; callers never hold it while waiting
+        self._lock = threading.Lock()
+
+    async def acquire(self, tokens: int = 0):
+        """Reserve one request and tokens, sleeping until both buckets can cover them"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _reserve(self, tokens: int) -> float:
+        """Take capacity from the buckets and return how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._last_refill = now
+
+            wait = 0.0
+            if self.requests_per_minute:
+                self._available_requests = min(
+                    self.requests_per_minute,
+                    self._available_requests + elapsed * self.requests_per_minute / 60
+                )
+                # Buckets may go negative: later callers queue behind earlier reservations
+                self._available_requests -= 1
+                if self._available_requests < 0:
+                    wait = max(wait, -self._available_requests * 60 / self.requests_per_minute)
+            if self.tokens_per_minute:
+                self._available_tokens = min(
+                    self.tokens_per_minute,
+                    self._available_tokens + elapsed * self.tokens_per_minute / 60
+                )
+                self._available_tokens -= min(tokens, self.tokens_per_minute)
+                if self._available_tokens < 0:
+                    wait = max(wait, -self._available_tokens * 60 / self.tokens_per_minute)
+            return wait
@@ -7,9 +7,6 @@ import os
 import sys
 from dotenv import load_dotenv
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 # Load environment variables from .env file
 load_dotenv()
 
@@ -22,4 +19,14 @@ if __name__ == "__main__":
     print("Starting FastAPI development server...")
     print(f"Frontend URL: {os.getenv('FRONTEND_URL', 'https://ai-yushas-growth-backlog-generator-ui.onrender.com')}")
     # Use import string instead of app object for reload functionality
-    uvicorn.run("app.api.endpoints:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    # uvloop + httptools match what the UvicornWorker picks up in production
+    # DEV=0 turns off auto-reload; HOST, PORT and LOG_LEVEL override the bind and verbosity
+    uvicorn.run(
+        "app.api.endpoints:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        reload=os.getenv("DEV", "1").lower() in ("1", "true", "yes"),
+        log_level=os.getenv("LOG_LEVEL", "INFO").lower(),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    ) 
\ No newline at end of file
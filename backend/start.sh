@@ -6,14 +6,13 @@ echo "Starting AI Growth Backlog Generator API..."
 # Install dependencies
 echo "Installing dependencies..."
 pip install -r requirements.txt
-
-# Export environment variables if needed
-export PYTHONPATH="${PYTHONPATH}:$(pwd)"
+pip install --no-deps -e ..
 
 # Start the application with gunicorn
 echo "Starting gunicorn server..."
 echo "PORT: $PORT"
 echo "Working directory: $(pwd)"
 
-# Use app.py:app instead of main:app for cleaner import
-gunicorn app:app --bind 0.0.0.0:$PORT --workers 1 --worker-class uvicorn.workers.UvicornWorker --log-level info --access-logfile - --error-logfile - 
\ No newline at end of file
+# main.py is the single entry point; the app package is installed above.
+# UvicornWorker runs on uvloop + httptools (pinned in requirements.txt).
+gunicorn main:app --bind 0.0.0.0:$PORT --workers 1 --worker-class uvicorn.workers.UvicornWorker --log-level info --access-logfile - --error-logfile - 
\ No newline at end of file
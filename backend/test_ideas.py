@@ -3,17 +3,18 @@
 Test script to verify idea generation works
 """
 
+import asyncio
+import io
 import os
-import sys
+from types import SimpleNamespace
+import numpy as np
 from dotenv import load_dotenv
+from PIL import Image
 
 # Load environment variables
 load_dotenv()
 
-# Add the current directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from app.services.growth_analyzer import GrowthAnalyzer
+from app.services.growth_analyzer import OCR_UNAVAILABLE_TEXT, GrowthAnalyzer
 
 def test_idea_generation():
     """Test that idea generation works"""
@@ -47,6 +48,66 @@ def test_idea_generation():
         print(f"❌ Test failed: {e}")
         return False
 
+def test_fallback_ideas_are_shared():
+    """Fallback ideas come from the shared catalog instead of being rebuilt per call"""
+    analyzer = GrowthAnalyzer(os.getenv("OPENAI_API_KEY", "test-key"))
+    first = analyzer._get_fallback_ideas()
+    second = analyzer._get_fallback_ideas()
+    assert len(first) == len(second) > 0
+    assert all(a is b for a, b in zip(first, second))
+
+def test_vision_batch_metadata_counts_pages():
+    """Submitting a Vision batch records the number of pages, not of prepared images"""
+    created = {}
+    
+    async def create_file(**kwargs):
+        return SimpleNamespace(id="file-1")
+    
+    async def create_batch(**kwargs):
+        created.update(kwargs)
+        return SimpleNamespace(id="batch-1")
+    
+    analyzer = GrowthAnalyzer(os.getenv("OPENAI_API_KEY", "test-key"))
+    analyzer.client = SimpleNamespace(
+        files=SimpleNamespace(create=create_file),
+        batches=SimpleNamespace(create=create_batch)
+    )
+    
+    pages = []
+    for _ in range(3):
+        buffer = io.BytesIO()
+        Image.new('RGB', (40, 60), 'white').save(buffer, format='PNG')
+        pages.append(buffer.getvalue())
+    
+    assert asyncio.run(analyzer.submit_vision_batch(pages)) == "batch-1"
+    assert created['metadata'] == {"page_count": "3"}
+
+def test_sections_stay_within_downscaled_image():
+    """Section rows scaled back up never run past the bottom of the original image"""
+    analyzer = GrowthAnalyzer(os.getenv("OPENAI_API_KEY", "test-key"))
+    
+    # 1107px wide pages are downscaled by a non-integer factor, which rounds 900 rows up to 901
+    page = np.zeros((900, 1107, 3), dtype=np.uint8)
+    page[100:400] = 255
+    page[400:700] = 128
+    
+    sections = analyzer._extract_visual_elements(page)['layout']['sections']
+    assert len(sections) == 4
+    assert sections[-1]['position']['y_end'] == 900
+
+def test_degraded_analysis_is_not_cached():
+    """Results built on placeholder OCR text are retried instead of served from the cache"""
+    analyzer = GrowthAnalyzer(os.getenv("OPENAI_API_KEY", "test-key"))
+    analyzer._extract_text = lambda pil_image: OCR_UNAVAILABLE_TEXT
+    
+    buffer = io.BytesIO()
+    Image.new('RGB', (400, 800), 'white').save(buffer, format='PNG')
+    
+    result = asyncio.run(analyzer.analyze_landing_page_async(buffer.getvalue()))
+    assert result['ideas']
+    assert len(analyzer.result_cache) == 0
+    assert len(analyzer.page_feature_cache) == 0
+
 if __name__ == "__main__":
     print("🧪 Testing idea generation...")
     success = test_idea_generation()
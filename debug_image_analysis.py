@@ -3,11 +3,15 @@
 Debug script to test AI image analysis and see why it's failing
 """
 
-import requests
+import asyncio
+import httpx
 import json
 import time
 import base64
-import os
+
+from _test_utils import response_json
+
+ANALYZE_URL = "http://localhost:8000/analyze-screenshot"
 
 def create_test_images():
     """Create different test images to simulate different landing pages"""
@@ -20,63 +24,46 @@ def create_test_images():
     
     return test_image_1, test_image_2
 
-def test_ai_image_analysis():
+async def post_screenshot(client, filename, image_bytes):
+    """Upload one in-memory test image to the analyze endpoint"""
+    files = {"file": (filename, image_bytes, "image/png")}
+    return await client.post(ANALYZE_URL, files=files)
+
+async def test_ai_image_analysis():
     """Test if AI image analysis is working properly"""
     
     print("🔍 Testing AI Image Analysis...")
     
     # Wait for backend to start
     print("Waiting for backend to start...")
-    time.sleep(3)
+    await asyncio.sleep(3)
     
-    # Create test images
+    # Create test images; they are uploaded straight from memory
     test_image_1, test_image_2 = create_test_images()
     
-    # Save test images
-    with open("test_landing_page_1.png", "wb") as f:
-        f.write(test_image_1)
-    
-    with open("test_landing_page_2.png", "wb") as f:
-        f.write(test_image_2)
-    
     results = []
     
     try:
-        # Test first image
-        print("\n📸 Testing Image 1...")
-        with open("test_landing_page_1.png", "rb") as f:
-            files = {"file": ("test_landing_page_1.png", f, "image/png")}
-            response = requests.post("http://localhost:8000/analyze-screenshot", files=files)
-        
-        if response.status_code == 200:
-            data_1 = response.json()
-            results.append({
-                'image': 'Image 1',
-                'ideas': data_1.get('ideas', []),
-                'metadata': data_1.get('metadata', {})
-            })
-            print(f"✅ Image 1: {len(data_1.get('ideas', []))} ideas generated")
-        else:
-            print(f"❌ Image 1 failed: {response.status_code}")
-            return False
+        # Analyze both images concurrently; each request waits on the model round-trip
+        print("\n📸 Testing Image 1 and Image 2...")
+        async with httpx.AsyncClient(timeout=None) as client:
+            responses = await asyncio.gather(
+                post_screenshot(client, "test_landing_page_1.png", test_image_1),
+                post_screenshot(client, "test_landing_page_2.png", test_image_2)
+            )
         
-        # Test second image
-        print("\n📸 Testing Image 2...")
-        with open("test_landing_page_2.png", "rb") as f:
-            files = {"file": ("test_landing_page_2.png", f, "image/png")}
-            response = requests.post("http://localhost:8000/analyze-screenshot", files=files)
-        
-        if response.status_code == 200:
-            data_2 = response.json()
-            results.append({
-                'image': 'Image 2',
-                'ideas': data_2.get('ideas', []),
-                'metadata': data_2.get('metadata', {})
-            })
-            print(f"✅ Image 2: {len(data_2.get('ideas', []))} ideas generated")
-        else:
-            print(f"❌ Image 2 failed: {response.status_code}")
-            return False
+        for label, response in zip(("Image 1", "Image 2"), responses):
+            if response.status_code == 200:
+                data = response_json(response)
+                results.append({
+                    'image': label,
+                    'ideas': data.get('ideas', []),
+                    'metadata': data.get('metadata', {})
+                })
+                print(f"✅ {label}: {len(data.get('ideas', []))} ideas generated")
+            else:
+                print(f"❌ {label} failed: {response.status_code}")
+                return False
         
         # Compare results
         print("\n🔍 Comparing Results:")
@@ -120,14 +107,9 @@ def test_ai_image_analysis():
     except Exception as e:
         print(f"❌ Test failed: {e}")
         return False
-    finally:
-        # Clean up test files
-        for filename in ["test_landing_page_1.png", "test_landing_page_2.png"]:
-            if os.path.exists(filename):
-                os.remove(filename)
 
 if __name__ == "__main__":
-    success = test_ai_image_analysis()
+    success = asyncio.run(test_ai_image_analysis())
     if success:
         print("\n✅ AI image analysis is working correctly!")
     else:
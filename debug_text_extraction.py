@@ -5,9 +5,35 @@ Debug script to see what text is being extracted from screenshots
 
 import requests
 import json
+import re
 import time
 import os
 
+from _test_utils import response_json
+
+# Indicators per business type, matched as plain substrings of the lowercased text
+BUSINESS_INDICATORS = {
+    "meditation_app": ['calm', 'meditation', 'sleep', 'relaxation', 'mindfulness', 'stress', 'anxiety'],
+    "learning_platform": ['learn', 'masterclass', 'course', 'lesson', 'education', 'skill', 'training', 'instructor', 'teacher'],
+    "ecommerce": ['shop', 'buy', 'purchase', 'product', 'store', 'cart', 'checkout', 'price', 'sale'],
+    "saas": ['software', 'app', 'platform', 'tool', 'solution', 'service', 'subscription', 'trial']
+}
+INDICATOR_TYPES = {
+    indicator: business_type
+    for business_type, indicators in BUSINESS_INDICATORS.items()
+    for indicator in indicators
+}
+# One pass over the text finds every indicator; the lookahead lets matches overlap
+# (no indicator is a prefix of another, so one match per position is enough)
+INDICATOR_RE = re.compile("(?=(%s))" % "|".join(map(re.escape, INDICATOR_TYPES)))
+
+def score_business_types(text_lower):
+    """Count the distinct indicators of each business type found in the text"""
+    scores = dict.fromkeys(BUSINESS_INDICATORS, 0)
+    for indicator in {match.group(1) for match in INDICATOR_RE.finditer(text_lower)}:
+        scores[INDICATOR_TYPES[indicator]] += 1
+    return scores
+
 def debug_text_extraction():
     """Debug what text is being extracted from screenshots"""
     
@@ -46,7 +72,7 @@ def debug_text_extraction():
             response = requests.post("http://localhost:8000/analyze-screenshot", files=files)
         
         if response.status_code == 200:
-            data = response.json()
+            data = response_json(response)
             metadata = data.get('metadata', {})
             
             extracted_text = metadata.get('extracted_text', '')
@@ -72,16 +98,12 @@ def debug_text_extraction():
             
             print(f"\n🏢 BUSINESS TYPE ANALYSIS:")
             
-            # Check for different business types
-            meditation_indicators = ['calm', 'meditation', 'sleep', 'relaxation', 'mindfulness', 'stress', 'anxiety']
-            learning_indicators = ['learn', 'masterclass', 'course', 'lesson', 'education', 'skill', 'training', 'instructor', 'teacher']
-            ecommerce_indicators = ['shop', 'buy', 'purchase', 'product', 'store', 'cart', 'checkout', 'price', 'sale']
-            saas_indicators = ['software', 'app', 'platform', 'tool', 'solution', 'service', 'subscription', 'trial']
-            
-            meditation_score = sum(1 for indicator in meditation_indicators if indicator in text_lower)
-            learning_score = sum(1 for indicator in learning_indicators if indicator in text_lower)
-            ecommerce_score = sum(1 for indicator in ecommerce_indicators if indicator in text_lower)
-            saas_score = sum(1 for indicator in saas_indicators if indicator in text_lower)
+            # Score every business type in one scan of the text
+            type_scores = score_business_types(text_lower)
+            meditation_score = type_scores["meditation_app"]
+            learning_score = type_scores["learning_platform"]
+            ecommerce_score = type_scores["ecommerce"]
+            saas_score = type_scores["saas"]
             
             print(f"   Meditation indicators found: {meditation_score}")
             print(f"   Learning indicators found: {learning_score}")
@@ -89,14 +111,7 @@ def debug_text_extraction():
             print(f"   SaaS indicators found: {saas_score}")
             
             # Determine expected business type
-            scores = [
-                ("meditation_app", meditation_score),
-                ("learning_platform", learning_score),
-                ("ecommerce", ecommerce_score),
-                ("saas", saas_score)
-            ]
-            
-            best_type = max(scores, key=lambda x: x[1])
+            best_type = max(type_scores.items(), key=lambda x: x[1])
             print(f"   Expected business type: {best_type[0]} (score: {best_type[1]})")
             
             # Check if text extraction is working properly
@@ -0,0 +1,22 @@
+"""
+Optional mypyc build for the pure-Python idea modules
+Set MYPYC_COMPILE=1 (with mypy installed and pip's --no-build-isolation) to compile
+them into C extensions; the .py sources are still installed as the fallback
+"""
+
+import os
+
+from setuptools import setup
+
+# Modules that type-check cleanly and avoid the optional numba/tesserocr imports
+MYPYC_MODULES = [
+    "backend/app/models/idea.py",
+    "backend/app/services/idea_catalog.py",
+]
+
+ext_modules = []
+if os.getenv("MYPYC_COMPILE", "").lower() in ("1", "true", "yes"):
+    from mypyc.build import mypycify
+    ext_modules = mypycify(MYPYC_MODULES, opt_level="3")
+
+setup(ext_modules=ext_modules)
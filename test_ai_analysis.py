@@ -3,11 +3,21 @@
 Comprehensive test to verify AI analysis with real screenshots
 """
 
-import requests
 import json
-import time
 import os
 
+from _test_utils import SESSION, compile_indicators, idea_text, response_json, truncate, wait_for_backend
+
+# Check for specific vs generic indicators
+SPECIFIC_RE = compile_indicators([
+    'change', 'replace', 'add', 'move', 'reduce', 'create', 'implement',
+    'specific', 'tactical', 'action-oriented', 'benefit-first'
+])
+
+GENERIC_RE = compile_indicators([
+    'optimize', 'improve', 'enhance', 'better', 'good', 'great'
+])
+
 def test_ai_analysis_with_real_screenshot():
     """Test AI analysis with a real screenshot"""
     
@@ -16,7 +26,7 @@ def test_ai_analysis_with_real_screenshot():
     
     # Wait for backend to start
     print("Waiting for backend to start...")
-    time.sleep(3)
+    wait_for_backend()
     
     # Check if there's a real screenshot to test with
     test_files = [
@@ -45,10 +55,10 @@ def test_ai_analysis_with_real_screenshot():
         # Test the analyze endpoint
         with open(test_file, "rb") as f:
             files = {"file": (test_file, f, "image/png")}
-            response = requests.post("http://localhost:8000/analyze-screenshot", files=files)
+            response = SESSION.post("http://localhost:8000/analyze-screenshot", files=files)
         
         if response.status_code == 200:
-            data = response.json()
+            data = response_json(response)
             ideas = data.get('ideas', [])
             metadata = data.get('metadata', {})
             
@@ -85,23 +95,10 @@ def test_ai_analysis_with_real_screenshot():
             generic_count = 0
             
             for i, idea in enumerate(ideas[:10], 1):  # Check first 10 ideas
-                title = idea.get('title', '').lower()
-                description = idea.get('description', '').lower()
-                
-                # Check for specific vs generic indicators
-                specific_indicators = [
-                    'change', 'replace', 'add', 'move', 'reduce', 'create', 'implement',
-                    'specific', 'tactical', 'action-oriented', 'benefit-first'
-                ]
-                
-                generic_indicators = [
-                    'optimize', 'improve', 'enhance', 'better', 'good', 'great'
-                ]
-                
-                has_specific = any(indicator in title or indicator in description for indicator in specific_indicators)
-                is_generic = any(phrase in title or phrase in description for phrase in generic_indicators)
+                text = idea_text(idea, 'title', 'description')
                 
-                if has_specific and not is_generic:
+                # The generic scan only runs for ideas that already look specific
+                if SPECIFIC_RE.search(text) is not None and GENERIC_RE.search(text) is None:
                     specific_count += 1
                     idea_type = "✅ SPECIFIC"
                 else:
@@ -144,7 +141,7 @@ def test_ai_analysis_with_real_screenshot():
                 
         else:
             print(f"❌ Request failed with status {response.status_code}")
-            print(f"Response: {response.text}")
+            print(f"Response: {truncate(response.text)}")
             return False
             
     except Exception as e:
